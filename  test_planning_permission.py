@@ -10,336 +10,513 @@ It covers all scenarios described in the decision matrix, including:
   - The effect of additional modifiers like new build property and PD rights removal.
 """
 
+import contextlib
+import io
+import itertools
+import os
+import subprocess
+import sys
 import unittest
-from planning_permission import get_planning_permission_decision
+from planning_permission import (
+    Height,
+    Location,
+    PlanningQuery,
+    Structure,
+    decide,
+    decide_codes,
+    get_planning_permission_decision,
+    get_planning_permission_decisions_batch,
+    main_cli,
+)
 
+try:
+    import numpy
+except ImportError:  # NumPy is optional; batch tests are skipped without it.
+    numpy = None
+
+try:
+    import planning_permission_numba
+except ImportError:  # Numba is optional; JIT tests are skipped without it.
+    planning_permission_numba = None
+
+# Parameter names of get_planning_permission_decision, in signature order.
+PARAMETERS = (
+    "location_of_enclosure",
+    "height_of_enclosure",
+    "structure_type",
+    "listed_building",
+    "article_2_3_land",
+    "article_2_4_land",
+    "article_4_directive",
+    "aonb",
+    "works_affecting_tpo",
+    "face_listed_building",
+    "new_build_property",
+    "pd_removed_by_previous_planning",
+)
+
+
+def all_input_combinations():
+    """Yield every valid argument tuple for get_planning_permission_decision."""
+    return itertools.product(
+        ("adjacent", "not_adjacent"),
+        ("up_to_1m", "above_1m", "up_to_2m", "above_2m"),
+        ("fence", "wall", "gate"),
+        *[(False, True)] * 9,
+    )
 
-class TestPlanningPermissionDecision(unittest.TestCase):
-    """Test cases for planning permission decision logic with 4 height categories."""
 
+# Decision-matrix scenarios: keyword arguments for get_planning_permission_decision
+# plus the expected decision. Flags not listed default to False.
+NO_FLAGS = dict.fromkeys(PARAMETERS[3:], False)
+
+CASES = [
     # -----------------------
-    # Universal Condition Tests
+    # Universal Conditions
     # -----------------------
-    def test_universal_listed_building(self):
-        """If the property is listed, permission is required regardless of other parameters."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="adjacent",
-            height_of_enclosure="up_to_1m",
-            structure_type="fence",
-            listed_building=True,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
-        )
-        self.assertEqual(result, "Y")
-
-    def test_universal_face_listed_building(self):
-        """If the enclosure faces a property with a listed building, permission is required."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="not_adjacent",
-            height_of_enclosure="up_to_1m",
-            structure_type="wall",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=True,  # 2U9 condition triggered
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
-        )
-        self.assertEqual(result, "Y")
+    # If the property is listed, permission is required regardless of other parameters.
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="adjacent",
+        height_of_enclosure="up_to_1m",
+        structure_type="fence",
+        listed_building=True,
+        expected="Y",
+    ),
+    # If the enclosure faces a property with a listed building, permission is required.
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="not_adjacent",
+        height_of_enclosure="up_to_1m",
+        structure_type="wall",
+        face_listed_building=True,
+        expected="Y",
+    ),
 
     # -----------------------
     # Non-Universal Cases for Fences (Adjacent)
     # -----------------------
-    def test_adjacent_fence_up_to_1m(self):
-        """An adjacent fence with height 'up_to_1m' is permitted (N)."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="adjacent",
-            height_of_enclosure="up_to_1m",
-            structure_type="fence",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
-        )
-        self.assertEqual(result, "N")
+    # An adjacent fence with height 'up_to_1m' is permitted (N).
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="adjacent",
+        height_of_enclosure="up_to_1m",
+        structure_type="fence",
+        expected="N",
+    ),
+    # An adjacent fence with height 'above_1m' should require permission (Y).
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="adjacent",
+        height_of_enclosure="above_1m",
+        structure_type="fence",
+        expected="Y",
+    ),
+    # An adjacent fence with height 'up_to_2m' (i.e. above 1m but not beyond 2m) requires permission (Y).
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="adjacent",
+        height_of_enclosure="up_to_2m",
+        structure_type="fence",
+        expected="Y",
+    ),
+    # An adjacent fence with height 'above_2m' requires permission (Y).
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="adjacent",
+        height_of_enclosure="above_2m",
+        structure_type="fence",
+        expected="Y",
+    ),
 
-    def test_adjacent_fence_above_1m(self):
-        """An adjacent fence with height 'above_1m' should require permission (Y)."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="adjacent",
-            height_of_enclosure="above_1m",
-            structure_type="fence",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
-        )
-        self.assertEqual(result, "Y")
+    # -----------------------
+    # Non-Universal Cases for Fences (Not Adjacent)
+    # -----------------------
+    # A non-adjacent fence with height 'up_to_1m' is permitted (N).
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="not_adjacent",
+        height_of_enclosure="up_to_1m",
+        structure_type="fence",
+        expected="N",
+    ),
+    # A non-adjacent fence with height 'above_1m' is permitted (N) since it is still below 2m.
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="not_adjacent",
+        height_of_enclosure="above_1m",
+        structure_type="fence",
+        expected="N",
+    ),
+    # A non-adjacent fence with height 'up_to_2m' is permitted (N).
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="not_adjacent",
+        height_of_enclosure="up_to_2m",
+        structure_type="fence",
+        expected="N",
+    ),
+    # A non-adjacent fence with height 'above_2m' requires permission (Y).
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="not_adjacent",
+        height_of_enclosure="above_2m",
+        structure_type="fence",
+        expected="Y",
+    ),
 
-    def test_adjacent_fence_up_to_2m(self):
-        """An adjacent fence with height 'up_to_2m' (i.e. above 1m but not beyond 2m) requires permission (Y)."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="adjacent",
-            height_of_enclosure="up_to_2m",
-            structure_type="fence",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
-        )
-        self.assertEqual(result, "Y")
+    # -----------------------
+    # Non-Universal Cases for Walls
+    # -----------------------
+    # A wall with height 'up_to_1m' is permitted (N).
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="adjacent",
+        height_of_enclosure="up_to_1m",
+        structure_type="wall",
+        expected="N",
+    ),
+    # A wall with height 'above_1m' is permitted (N).
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="not_adjacent",
+        height_of_enclosure="above_1m",
+        structure_type="wall",
+        expected="N",
+    ),
+    # A wall with height 'up_to_2m' is permitted (N).
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="adjacent",
+        height_of_enclosure="up_to_2m",
+        structure_type="wall",
+        expected="N",
+    ),
+    # A wall with height 'above_2m' requires permission (Y).
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="not_adjacent",
+        height_of_enclosure="above_2m",
+        structure_type="wall",
+        expected="Y",
+    ),
 
-    def test_adjacent_fence_above_2m(self):
-        """An adjacent fence with height 'above_2m' requires permission (Y)."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="adjacent",
-            height_of_enclosure="above_2m",
-            structure_type="fence",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
-        )
-        self.assertEqual(result, "Y")
+    # -----------------------
+    # Cases for Gates with New Build Restrictions
+    # -----------------------
+    # A gate on a non-new build property is permitted (N), regardless of height.
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="adjacent",
+        height_of_enclosure="up_to_1m",
+        structure_type="gate",
+        expected="N",
+    ),
+    # A gate on a new build property requires permission (Y).
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="not_adjacent",
+        height_of_enclosure="up_to_1m",
+        structure_type="gate",
+        new_build_property=True,
+        expected="Y",
+    ),
 
     # -----------------------
-    # Non-Universal Cases for Fences (Not Adjacent)
+    # Modifier: PD Rights Removed by Previous Planning
     # -----------------------
-    def test_non_adjacent_fence_up_to_1m(self):
-        """A non-adjacent fence with height 'up_to_1m' is permitted (N)."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="not_adjacent",
-            height_of_enclosure="up_to_1m",
-            structure_type="fence",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
+    # If PD rights are removed by previous planning, permission is required (Y) regardless of baseline.
+    dict(
+        NO_FLAGS,
+        location_of_enclosure="adjacent",
+        height_of_enclosure="up_to_1m",
+        structure_type="fence",
+        pd_removed_by_previous_planning=True,
+        expected="Y",
+    ),
+]
+
+
+def reference_decision(location, height, structure, *flags):
+    """Straightforward restatement of the decision matrix, used as a test oracle."""
+    *universal, new_build, pd_removed = flags
+    if any(universal) or pd_removed:
+        return "Y"
+    if structure == "gate":
+        return "Y" if new_build else "N"
+    if structure == "fence" and location == "adjacent":
+        return "N" if height == "up_to_1m" else "Y"
+    return "Y" if height == "above_2m" else "N"
+
+
+class TestPlanningPermissionDecision(unittest.TestCase):
+    """Test cases for planning permission decision logic with 4 height categories."""
+
+    def test_decision_matrix(self):
+        """Each scenario in CASES gives its expected decision."""
+        for case in CASES:
+            case = dict(case)
+            expected = case.pop("expected")
+            with self.subTest(**case):
+                self.assertEqual(get_planning_permission_decision(**case), expected)
+
+    def test_all_combinations_against_reference(self):
+        """Every valid input combination matches the reference decision."""
+        for row in all_input_combinations():
+            with self.subTest(row=row):
+                self.assertEqual(
+                    get_planning_permission_decision(*row), reference_decision(*row)
+                )
+
+
+class TestInputValidation(unittest.TestCase):
+    """Test cases for structure/location/height input handling."""
+
+    FLAGS = (False,) * 9
+
+    def test_enum_inputs(self):
+        """Structure/Location/Height members give the same result as their strings."""
+        self.assertEqual(
+            get_planning_permission_decision(
+                Location.NOT_ADJACENT, Height.ABOVE_2M, Structure.WALL, *self.FLAGS
+            ),
+            "Y",
         )
-        self.assertEqual(result, "N")
 
-    def test_non_adjacent_fence_above_1m(self):
-        """A non-adjacent fence with height 'above_1m' is permitted (N) since it is still below 2m."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="not_adjacent",
-            height_of_enclosure="above_1m",
-            structure_type="fence",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
+    def test_mixed_case_structure_type(self):
+        """Structure types that are not lower case are normalised."""
+        self.assertEqual(
+            get_planning_permission_decision(
+                "adjacent", "above_1m", "Fence", *self.FLAGS
+            ),
+            "Y",
         )
-        self.assertEqual(result, "N")
 
-    def test_non_adjacent_fence_up_to_2m(self):
-        """A non-adjacent fence with height 'up_to_2m' is permitted (N)."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="not_adjacent",
-            height_of_enclosure="up_to_2m",
-            structure_type="fence",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
+    def test_truthy_new_build_flag(self):
+        """A truthy non-bool new build flag is treated as True, not packed into the key."""
+        self.assertEqual(
+            get_planning_permission_decision(
+                "adjacent", "up_to_1m", "gate", *self.FLAGS[:7], 2, False
+            ),
+            "Y",
         )
-        self.assertEqual(result, "N")
+        self.assertEqual(decide_codes(Structure.GATE, 0, 0, False, 2), "Y")
 
-    def test_non_adjacent_fence_above_2m(self):
-        """A non-adjacent fence with height 'above_2m' requires permission (Y)."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="not_adjacent",
-            height_of_enclosure="above_2m",
-            structure_type="fence",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
+    def test_int_flags(self):
+        """Universal condition flags may be ints as well as bools."""
+        self.assertEqual(
+            get_planning_permission_decision(
+                "adjacent", "up_to_1m", "fence", 0, 0, 0, 0, 0, 0, 1, False, 0
+            ),
+            "Y",
         )
-        self.assertEqual(result, "Y")
 
-    # -----------------------
-    # Non-Universal Cases for Walls
-    # -----------------------
-    def test_wall_up_to_1m(self):
-        """A wall with height 'up_to_1m' is permitted (N)."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="adjacent",  # Location is less important for walls.
-            height_of_enclosure="up_to_1m",
-            structure_type="wall",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
+    def test_non_bool_flag(self):
+        """A universal condition flag that is neither bool nor int raises TypeError."""
+        with self.assertRaises(TypeError):
+            get_planning_permission_decision(
+                "adjacent", "up_to_1m", "fence", None, *self.FLAGS[1:]
+            )
+
+    def test_unknown_structure_type(self):
+        """An unrecognised structure type raises ValueError."""
+        with self.assertRaises(ValueError):
+            get_planning_permission_decision("adjacent", "up_to_1m", "hedge", *self.FLAGS)
+
+
+class TestPlanningQuery(unittest.TestCase):
+    """Test cases for the PlanningQuery struct entry point."""
+
+    def test_decide_matches_scalar_for_all_combinations(self):
+        """decide(PlanningQuery(...)) agrees with the keyword-argument API on every input."""
+        for row in all_input_combinations():
+            self.assertEqual(
+                decide(PlanningQuery(*row)), get_planning_permission_decision(*row)
+            )
+
+    def test_query_is_immutable(self):
+        """A PlanningQuery cannot be modified after construction."""
+        query = PlanningQuery("adjacent", "up_to_1m", "fence")
+        with self.assertRaises(AttributeError):
+            query.listed_building = True
+
+
+class TestMainCli(unittest.TestCase):
+    """Test cases for the single-shot command-line entry point."""
+
+    def run_cli(self, *argv):
+        """Run main_cli with the given arguments and return its printed output."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            main_cli(list(argv))
+        return output.getvalue().strip()
+
+    def test_cli_permitted(self):
+        """An adjacent fence up to 1m with no flags set is permitted (N)."""
+        result = self.run_cli(
+            "--structure", "fence", "--location", "adjacent", "--height", "up_to_1m"
         )
         self.assertEqual(result, "N")
 
-    def test_wall_above_1m(self):
-        """A wall with height 'above_1m' is permitted (N)."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="not_adjacent",
-            height_of_enclosure="above_1m",
-            structure_type="wall",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
+    def test_cli_flag_requires_permission(self):
+        """Boolean flags are passed through, e.g. a gate on a new build requires permission (Y)."""
+        result = self.run_cli(
+            "--structure", "gate",
+            "--location", "not_adjacent",
+            "--height", "up_to_1m",
+            "--new-build-property",
         )
-        self.assertEqual(result, "N")
+        self.assertEqual(result, "Y")
+
+    def test_cli_missing_required_option(self):
+        """Omitting the height outside interactive mode is a usage error."""
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                self.run_cli("--structure", "wall", "--location", "adjacent")
+
+
+class TestDecideCodes(unittest.TestCase):
+    """Test cases for the integer-code entry point (compiled or pure Python)."""
+
+    def test_codes_match_scalar_for_all_combinations(self):
+        """decide_codes agrees with get_planning_permission_decision on every input."""
+        for row in all_input_combinations():
+            location, height, structure = row[:3]
+            override = any(row[3:10]) or row[11]
+            self.assertEqual(
+                decide_codes(
+                    Structure[structure.upper()],
+                    Location[location.upper()],
+                    Height[height.upper()],
+                    override,
+                    row[10],
+                ),
+                get_planning_permission_decision(*row),
+            )
+
+    def test_codes_out_of_range(self):
+        """An out-of-range code raises ValueError."""
+        with self.assertRaises(ValueError):
+            decide_codes(3, 0, 0, False, False)
+
 
-    def test_wall_up_to_2m(self):
-        """A wall with height 'up_to_2m' is permitted (N)."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="adjacent",
-            height_of_enclosure="up_to_2m",
-            structure_type="wall",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestPlanningPermissionDecisionsBatch(unittest.TestCase):
+    """Test cases for the vectorized batch decision function."""
+
+    def test_batch_matches_scalar_for_all_combinations(self):
+        """Every row of the batch result matches the scalar decision for the same inputs."""
+        rows = list(all_input_combinations())
+        columns = {
+            name: numpy.array(values) for name, values in zip(PARAMETERS, zip(*rows))
+        }
+        result = get_planning_permission_decisions_batch(columns)
+        expected = [get_planning_permission_decision(*row) for row in rows]
+        self.assertEqual(result.tolist(), expected)
+
+    def batch_columns(self, structure_types, **flags):
+        """Build batch columns for the given structure types, other flags False."""
+        size = len(structure_types)
+        columns = dict.fromkeys(PARAMETERS[3:], [False] * size)
+        columns.update(
+            location_of_enclosure=["adjacent"] * size,
+            height_of_enclosure=["up_to_1m"] * size,
+            structure_type=structure_types,
+            **flags,
         )
-        self.assertEqual(result, "N")
+        return columns
 
-    def test_wall_above_2m(self):
-        """A wall with height 'above_2m' requires permission (Y)."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="not_adjacent",
-            height_of_enclosure="above_2m",
-            structure_type="wall",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
+    def test_batch_rejects_unknown_category(self):
+        """An unrecognised structure type in a batch raises ValueError naming the value."""
+        with self.assertRaisesRegex(ValueError, "Unrecognised structure_type: 'hedge'"):
+            get_planning_permission_decisions_batch(self.batch_columns(["hedge"]))
+
+    def test_batch_mixed_strings_and_enum_members(self):
+        """A column mixing enum members and strings is coerced element by element."""
+        columns = self.batch_columns(
+            [Structure.GATE, "gate", Structure.FENCE],
+            new_build_property=[True, False, False],
         )
-        self.assertEqual(result, "Y")
+        result = get_planning_permission_decisions_batch(columns)
+        self.assertEqual(result.tolist(), ["Y", "N", "N"])
 
-    # -----------------------
-    # Cases for Gates with New Build Restrictions
-    # -----------------------
-    def test_gate_non_new_build(self):
-        """A gate on a non-new build property is permitted (N), regardless of height."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="adjacent",  # For gates, location is less critical.
-            height_of_enclosure="up_to_1m",  # Height is not used for gate logic.
-            structure_type="gate",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=False,
+    def test_batch_mixed_column_rejects_unknown_category(self):
+        """An unrecognised value in a mixed column raises ValueError naming the value."""
+        columns = self.batch_columns([Structure.GATE, "hedge"])
+        with self.assertRaisesRegex(ValueError, "Unrecognised structure_type: 'hedge'"):
+            get_planning_permission_decisions_batch(columns)
+
+    def test_batch_matches_scalar_input_handling(self):
+        """
+        Like the scalar API, the batch accepts mixed-case categories and does not
+        validate rows already forced to "Y" by a universal condition.
+        """
+        columns = self.batch_columns(
+            ["Fence", "hedge", "gate"],
+            listed_building=[False, True, False],
+            new_build_property=[False, False, 2],
         )
-        self.assertEqual(result, "N")
+        result = get_planning_permission_decisions_batch(columns)
+        self.assertEqual(result.tolist(), ["N", "Y", "Y"])
+
 
-    def test_gate_new_build(self):
-        """A gate on a new build property requires permission (Y)."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="not_adjacent",
-            height_of_enclosure="up_to_1m",  # Height irrelevant for gate decision.
-            structure_type="gate",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=True,
-            pd_removed_by_previous_planning=False,
+@unittest.skipIf(planning_permission_numba is None, "Numba is not installed")
+class TestPlanningPermissionNumba(unittest.TestCase):
+    """Test cases for the Numba-compiled decision, with the JIT on and off."""
+
+    def test_jit_matches_scalar_for_all_combinations(self):
+        """The compiled kernel agrees with get_planning_permission_decision on every input."""
+        decide_numba = planning_permission_numba.get_planning_permission_decision_numba
+        for row in all_input_combinations():
+            self.assertEqual(decide_numba(*row), get_planning_permission_decision(*row))
+
+    def test_flags_checked_before_enclosure_inputs(self):
+        """A universal condition gives "Y" even for an unrecognised structure type."""
+        decide_numba = planning_permission_numba.get_planning_permission_decision_numba
+        self.assertEqual(
+            decide_numba("adjacent", "up_to_1m", "hedge", True, *(False,) * 8), "Y"
         )
-        self.assertEqual(result, "Y")
 
-    # -----------------------
-    # Test Modifier: PD Rights Removed by Previous Planning
-    # -----------------------
-    def test_pd_removed_overrides(self):
-        """If PD rights are removed by previous planning, permission is required (Y) regardless of baseline."""
-        result = get_planning_permission_decision(
-            location_of_enclosure="adjacent",
-            height_of_enclosure="up_to_1m",  # Normally permitted for an adjacent fence.
-            structure_type="fence",
-            listed_building=False,
-            article_2_3_land=False,
-            article_2_4_land=False,
-            article_4_directive=False,
-            aonb=False,
-            works_affecting_tpo=False,
-            face_listed_building=False,
-            new_build_property=False,
-            pd_removed_by_previous_planning=True,  # Override flag
+    def test_jit_matches_interpreted_kernel(self):
+        """
+        The kernel and its pure-Python body (as run under NUMBA_DISABLE_JIT=1)
+        agree on every integer input, guarding against boolean-semantics differences.
+        With the JIT disabled, the kernel is already the plain Python function.
+        """
+        kernel = planning_permission_numba.decide_nb
+        interpreted = getattr(kernel, "py_func", kernel)
+        for args in itertools.product(
+            range(2), range(4), range(3), (0, 1, 64, 127), range(2), range(2)
+        ):
+            self.assertEqual(kernel(*args), interpreted(*args))
+
+    def test_array_kernel_matches_scalar_kernel(self):
+        """decide_nb_array gives decide_nb's result for every row."""
+        rows = list(
+            itertools.product(
+                range(2), range(4), range(3), (0, 1, 64, 127), range(2), range(2)
+            )
         )
-        self.assertEqual(result, "Y")
+        columns = [numpy.array(column, dtype=numpy.int64) for column in zip(*rows)]
+        result = planning_permission_numba.decide_nb_array(*columns)
+        self.assertEqual(
+            result.tolist(), [planning_permission_numba.decide_nb(*row) for row in rows]
+        )
+
+    @unittest.skipIf(
+        os.environ.get("NUMBA_DISABLE_JIT") == "1", "Already running with the JIT disabled"
+    )
+    def test_suite_passes_with_jit_disabled(self):
+        """The Numba tests also pass in a fresh interpreter with NUMBA_DISABLE_JIT=1."""
+        module = os.path.splitext(os.path.basename(__file__))[0]
+        completed = subprocess.run(
+            [sys.executable, "-m", "unittest", f"{module}.{type(self).__name__}"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=dict(os.environ, NUMBA_DISABLE_JIT="1"),
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(completed.returncode, 0, completed.stderr)
 
 
 if __name__ == "__main__":
@@ -35,6 +35,7 @@ Step 2. Non-Universal Baseline Conditions:
 Step 3. Other Modifiers:
   Additional factors override the baseline outcome:
     - PD Rights Removed with Previous Planning: if True, the outcome is forced to "Y".
+      As this does not depend on the baseline, it is checked before Step 2.
     - New Build Property Restrictions: for example, a gate on a new build property will require permission.
 
 Design Criteria:
@@ -49,19 +50,111 @@ Notes on Approach:
 Difficult/Easy Parts:
   - Universal conditions are straightforward.
   - Non-universal conditions require careful differentiation among the four height categories.
-  - The modifiers add additional complexity and are applied last.
+  - The modifiers add additional complexity. New build restrictions are folded into the
+    baseline table; the PD-removed override is checked up front with the universal conditions.
 """
 
+import argparse
+import functools
 import logging
+import sys
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Union
 
-# Configure logging to display messages at INFO level or higher.
-logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
+class Structure(IntEnum):
+    """Structure type of the enclosure."""
 
+    FENCE = 0
+    WALL = 1
+    GATE = 2
+
+
+class Location(IntEnum):
+    """Location of the enclosure relative to a road/highway."""
+
+    ADJACENT = 0
+    NOT_ADJACENT = 1
+
+
+class Height(IntEnum):
+    """Height category of the enclosure, ordered from lowest to highest."""
+
+    UP_TO_1M = 0
+    ABOVE_1M = 1
+    UP_TO_2M = 2
+    ABOVE_2M = 3
+
+
+# String -> integer code lookups, used to coerce string inputs once per call.
+_S = {member.name.lower(): member.value for member in Structure}
+_L = {member.name.lower(): member.value for member in Location}
+_H = {member.name.lower(): member.value for member in Height}
+
+
+def _coerce(value, codes: dict, enum_type: type) -> int:
+    """
+    Coerce a string or enum input to its integer code.
+
+    Hot paths first try a plain codes.get(value), which resolves the expected
+    lower-case strings, and only call this for everything else. Here an
+    unrecognised string that is not already lower case is lower-cased and
+    retried.
+
+    Raises:
+      ValueError: If the value is not a recognised category.
+    """
+    if not isinstance(value, str):
+        return enum_type(value)
+    code = codes.get(value)
+    if code is None and not value.islower():
+        code = codes.get(value.lower())
+    if code is None:
+        raise ValueError(f"Unrecognised {enum_type.__name__.lower()}: {value!r}")
+    return code
+
+
+def _compute_baseline(
+    structure: Structure, location: Location, height: Height, new_build: bool
+) -> str:
+    """
+    Evaluate the non-universal baseline (Step 2) for a single combination.
+
+    Height categories are ordered, so each rule is a single threshold
+    comparison. This is only used at import time to populate _Y_KEYS.
+    """
+    if structure == Structure.GATE:
+        # For gates, unless it's a new build (which forces a "Y"), they are permitted.
+        return "Y" if new_build else "N"
+    if structure == Structure.FENCE and location == Location.ADJACENT:
+        # Adjacent fences: permitted only if "up_to_1m";
+        # any category above 1m ("above_1m", "up_to_2m", "above_2m") requires permission.
+        return "Y" if height > Height.UP_TO_1M else "N"
+    # Non-adjacent fences and walls require permission only if height is "above_2m".
+    return "Y" if height > Height.UP_TO_2M else "N"
+
+
+# Precomputed non-universal baseline: the set of packed keys
+# (structure << 4) | (location << 3) | (height << 1) | new_build whose baseline
+# is "Y". Of the 3 structures x 2 locations x 4 heights x 2 new-build flags = 48
+# combinations, only the minority requiring permission are stored; every other
+# valid key is "N".
+_Y_KEYS = frozenset(
+    (structure << 4) | (location << 3) | (height << 1) | new_build
+    for structure in Structure
+    for location in Location
+    for height in Height
+    for new_build in (False, True)
+    if _compute_baseline(structure, location, height, new_build) == "Y"
+)
+
+
+@functools.lru_cache(maxsize=None)
 def get_planning_permission_decision(
-    location_of_enclosure: str,  # Expected: "adjacent" or "not_adjacent"
-    height_of_enclosure: str,  # Expected: "up_to_1m", "above_1m", "up_to_2m", or "above_2m"
-    structure_type: str,  # Expected: "fence", "wall", or "gate"
+    location_of_enclosure: Union[str, Location],  # Expected: "adjacent" or "not_adjacent"
+    height_of_enclosure: Union[str, Height],  # Expected: "up_to_1m", "above_1m", "up_to_2m", or "above_2m"
+    structure_type: Union[str, Structure],  # Expected: "fence", "wall", or "gate" (lower case)
     listed_building: bool,
     article_2_3_land: bool,  # Universal: Article 2(3) Land removing PD rights.
     article_2_4_land: bool,  # Universal: Article 2(4) Land removing PD rights.
@@ -77,7 +170,6 @@ def get_planning_permission_decision(
 
     Step 1: Universal Conditions.
       If ANY universal condition is True, return "Y".
-      (We collect all universal conditions for audit purposes.)
 
     Step 2: Non-Universal Baseline Conditions.
       Evaluate based on structure type, location, and 4-level height.
@@ -90,58 +182,291 @@ def get_planning_permission_decision(
         - Permitted if height is not "above_2m", else permission required.
       For gates:
         - Generally permitted unless the site is a new build.
+      Structure, location and height may be given either as lower-case strings
+      (as produced by prompt_user_for_input; other casings are accepted but
+      normalised on a slower path) or as Structure/Location/Height members.
+      They are coerced to integer codes and packed into a key that is looked
+      up in the precomputed _Y_KEYS set rather than re-evaluated on every call.
 
     Step 3: Other Modifiers.
       If PD rights were removed with previous planning, return "Y" (override baseline).
+      Because this override does not depend on the baseline, it is checked
+      together with the universal conditions, before any baseline lookup.
+
+    Results are memoized with functools.lru_cache: every argument is an
+    immutable str/bool, so repeated evaluations of the same profile are a
+    single cache lookup. Arguments must therefore be hashable. The cache is
+    unbounded: positional and keyword calls are cached under different keys,
+    so the ~6k valid inputs can occupy twice that many entries, all small.
+
+    The universal conditions and PD-removed flag are combined with a bitwise
+    OR, so they must be bool (or int); other types such as None raise
+    TypeError rather than being treated as False.
 
     Returns:
       "Y" if planning permission is required; otherwise, "N".
+
+    Raises:
+      ValueError: If the structure type, location or height is not recognised.
+      TypeError: If a universal condition or the PD-removed flag is not a bool or int.
     """
-    # Step 1: Universal Conditions
-    universal_flags = [
-        listed_building,
-        article_2_3_land,
-        article_2_4_land,
-        article_4_directive,
-        aonb,
-        works_affecting_tpo,
-        face_listed_building,  # 2U9 condition.
-    ]
-    if any(universal_flags):
+    # Step 1: Universal Conditions, plus the PD-removed override from Step 3.
+    # Both force "Y" regardless of the baseline, so they are combined with a
+    # bitwise OR (bools are ints) into a single mask and tested once.
+    if (
+        listed_building
+        | article_2_3_land
+        | article_2_4_land
+        | article_4_directive
+        | aonb
+        | works_affecting_tpo
+        | face_listed_building  # 2U9 condition.
+        | pd_removed_by_previous_planning
+    ):
         return "Y"
 
     # Step 2: Non-Universal Baseline Conditions
-    structure = structure_type.lower()
+    # Lower-case strings resolve with a single dict lookup; enum members,
+    # other casings and invalid values take the slower _coerce path.
+    structure = _S.get(structure_type)
+    if structure is None:
+        structure = _coerce(structure_type, _S, Structure)
+    location = _L.get(location_of_enclosure)
+    if location is None:
+        location = _coerce(location_of_enclosure, _L, Location)
+    height = _H.get(height_of_enclosure)
+    if height is None:
+        height = _coerce(height_of_enclosure, _H, Height)
+    key = (
+        (structure << 4)
+        | (location << 3)
+        | (height << 1)
+        | (1 if new_build_property else 0)
+    )
+    return "Y" if key in _Y_KEYS else "N"
 
-    if structure == "gate":
-        # For gates, unless it's a new build (which forces a "Y"), they are permitted.
-        baseline = "Y" if new_build_property else "N"
-    elif structure == "fence":
-        if location_of_enclosure == "adjacent":
-            # Adjacent fences: permitted only if exactly "up_to_1m";
-            # if height is any category above 1m ("above_1m", "up_to_2m", "above_2m"), then permission is required.
-            if height_of_enclosure == "up_to_1m":
-                baseline = "N"
-            else:
-                baseline = "Y"
-        else:  # "not_adjacent"
-            # For non-adjacent fences, permission is required only if height is "above_2m".
-            if height_of_enclosure == "above_2m":
-                baseline = "Y"
-            else:
-                baseline = "N"
-    elif structure == "wall":
-        # Walls are permitted if their height is not above 2m.
-        baseline = "Y" if height_of_enclosure == "above_2m" else "N"
-    else:
-        baseline = "N"
 
-    # Step 3: Other Modifiers
-    # If PD rights have been removed with previous planning, override the baseline.
-    if pd_removed_by_previous_planning:
+@dataclass(frozen=True, slots=True)
+class PlanningQuery:
+    """
+    The full set of inputs for one planning permission decision.
+
+    Construct once and pass to decide() when the same profile is evaluated
+    repeatedly; fields match the parameters of get_planning_permission_decision.
+    """
+
+    location_of_enclosure: Union[str, Location]
+    height_of_enclosure: Union[str, Height]
+    structure_type: Union[str, Structure]
+    listed_building: bool = False
+    article_2_3_land: bool = False
+    article_2_4_land: bool = False
+    article_4_directive: bool = False
+    aonb: bool = False
+    works_affecting_tpo: bool = False
+    face_listed_building: bool = False
+    new_build_property: bool = False
+    pd_removed_by_previous_planning: bool = False
+
+
+def decide(query: PlanningQuery) -> str:
+    """
+    Determine planning permission for a PlanningQuery.
+
+    Forwards the fields positionally to get_planning_permission_decision,
+    avoiding per-call keyword-argument packing.
+
+    Returns:
+      "Y" if planning permission is required; otherwise, "N".
+    """
+    return get_planning_permission_decision(
+        query.location_of_enclosure,
+        query.height_of_enclosure,
+        query.structure_type,
+        query.listed_building,
+        query.article_2_3_land,
+        query.article_2_4_land,
+        query.article_4_directive,
+        query.aonb,
+        query.works_affecting_tpo,
+        query.face_listed_building,
+        query.new_build_property,
+        query.pd_removed_by_previous_planning,
+    )
+
+
+def decide_codes(
+    structure: int, location: int, height: int, override: bool, new_build: bool
+) -> str:
+    """
+    Decide planning permission from pre-coerced integer codes.
+
+    This is the low-level entry point for callers that already hold
+    Structure/Location/Height codes and have combined the universal conditions
+    and the PD-removed override into a single flag. If the optional compiled
+    extension (planning_permission_core) has been built, it replaces this
+    pure-Python implementation. get_planning_permission_decision inlines the
+    same _Y_KEYS lookup instead of calling this, as its inputs are already
+    validated and a further call would only add overhead.
+
+    Args:
+      structure: A Structure code.
+      location: A Location code.
+      height: A Height code.
+      override: True if any universal condition holds or PD rights were removed.
+      new_build: True for a new build property.
+
+    Returns:
+      "Y" if planning permission is required; otherwise, "N".
+
+    Raises:
+      ValueError: If any code is out of range.
+    """
+    if override:
         return "Y"
+    if not (0 <= structure < 3 and 0 <= location < 2 and 0 <= height < 4):
+        raise ValueError("Enclosure codes out of range")
+    key = (structure << 4) | (location << 3) | (height << 1) | bool(new_build)
+    return "Y" if key in _Y_KEYS else "N"
+
+
+try:
+    from planning_permission_core import decide_codes  # noqa: F811
+except ImportError:
+    pass
 
-    return baseline
+
+# Names of the universal-condition parameters, in signature order.
+_UNIVERSAL_FIELDS = (
+    "listed_building",
+    "article_2_3_land",
+    "article_2_4_land",
+    "article_4_directive",
+    "aonb",
+    "works_affecting_tpo",
+    "face_listed_building",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _y_table():
+    """
+    Return _Y_KEYS as a 48-entry NumPy boolean array indexed by packed key.
+
+    Built once, on the first batch call, so NumPy is not imported with the module.
+    """
+    import numpy as np
+
+    table = np.zeros(len(Structure) << 4, dtype=bool)
+    table[list(_Y_KEYS)] = True
+    table.flags.writeable = False
+    return table
+
+
+def _encode_column(np, values, codes: dict, enum_type: type, name: str, checked):
+    """
+    Map a column of category strings and/or enum members (or integer codes)
+    to integer codes.
+
+    Strings are matched case-insensitively, as in the scalar API. Columns of
+    only strings or only integers are encoded in vectorized form; a column
+    mixing strings and enum members is coerced element by element. Only rows
+    selected by the boolean mask `checked` must hold a recognised category;
+    unrecognised values in other rows (already decided by an override) are
+    mapped to code 0.
+
+    Raises ValueError if a checked row holds an unrecognised category.
+    """
+    # Non-array sequences (e.g. lists) are read as objects so that a mix of
+    # strings and enum members is not silently turned into strings like "2".
+    values = np.asarray(values, dtype=None if hasattr(values, "dtype") else object)
+    if values.dtype.kind == "O":
+        types = set(map(type, values))
+        if all(issubclass(kind, str) for kind in types):
+            values = values.astype(str)
+        elif all(issubclass(kind, (int, np.integer)) for kind in types):
+            values = values.astype(np.intp)
+
+    if values.dtype.kind in "iu":
+        unknown = (values < 0) | (values >= len(codes))
+        result = values.astype(np.intp)
+    elif values.dtype.kind == "O":
+        result = np.zeros(len(values), dtype=np.intp)
+        unknown = np.zeros(len(values), dtype=bool)
+        for row, value in enumerate(values):
+            try:
+                result[row] = _coerce(value, codes, enum_type)
+            except ValueError:
+                unknown[row] = True
+    else:
+        values = values.astype(str)
+        keys = np.array(sorted(codes))
+        positions = np.searchsorted(keys, values).clip(0, len(keys) - 1)
+        unknown = keys[positions] != values
+        if unknown.any():
+            # As in the scalar API, only unmatched values are lower-cased and retried.
+            lowered = np.char.lower(values[unknown])
+            retry = np.searchsorted(keys, lowered).clip(0, len(keys) - 1)
+            positions[unknown] = retry
+            unknown[unknown] = keys[retry] != lowered
+        result = np.array([codes[key] for key in keys], dtype=np.intp)[positions]
+    invalid = unknown & checked
+    if invalid.any():
+        value = values[invalid.argmax()]
+        if isinstance(value, np.generic):
+            value = value.item()
+        raise ValueError(f"Unrecognised {name}: {value!r}")
+    result[unknown] = 0
+    return result
+
+
+def get_planning_permission_decisions_batch(columns):
+    """
+    Vectorized counterpart of get_planning_permission_decision for bulk workloads.
+
+    Args:
+      columns: A mapping with one equal-length column per parameter of
+        get_planning_permission_decision (e.g. a dict of NumPy arrays or a
+        pandas DataFrame). Structure, location and height columns may hold
+        the usual strings, Structure/Location/Height members or integer
+        codes; a column mixing strings and members is also accepted.
+
+    Returns:
+      A NumPy array of "Y"/"N" decisions, one per row.
+
+    Requires NumPy, which is imported on first use so the scalar API keeps
+    working without it.
+    """
+    import numpy as np
+
+    # Step 1 and the PD-removed override of Step 3 are a single vectorized OR.
+    override = np.asarray(columns["pd_removed_by_previous_planning"], dtype=bool)
+    for name in _UNIVERSAL_FIELDS:
+        override = override | np.asarray(columns[name], dtype=bool)
+
+    # Step 2: gather the baseline from a lookup table built from the same _Y_KEYS
+    # set as the scalar path.
+    # Rows already forced to "Y" are not validated, matching the scalar API.
+    checked = ~override
+    structure = _encode_column(
+        np, columns["structure_type"], _S, Structure, "structure_type", checked
+    )
+    location = _encode_column(
+        np,
+        columns["location_of_enclosure"],
+        _L,
+        Location,
+        "location_of_enclosure",
+        checked,
+    )
+    height = _encode_column(
+        np, columns["height_of_enclosure"], _H, Height, "height_of_enclosure", checked
+    )
+    new_build = np.asarray(columns["new_build_property"], dtype=bool).astype(np.intp)
+    index = (structure << 4) | (location << 3) | (height << 1) | new_build
+
+    required = override | _y_table()[index]
+    return np.where(required, "Y", "N")
 
 
 def get_numeric_choice(prompt_text: str, valid_choices: dict) -> int:
@@ -219,16 +544,14 @@ def prompt_user_for_input() -> None:
     )
 
     # Early universal check:
-    if any(
-        [
-            listed_building,
-            article_2_3_land,
-            article_2_4_land,
-            article_4_directive,
-            aonb,
-            works_affecting_tpo,
-            face_listed_building,
-        ]
+    if (
+        listed_building
+        or article_2_3_land
+        or article_2_4_land
+        or article_4_directive
+        or aonb
+        or works_affecting_tpo
+        or face_listed_building
     ):
         print("\nOne or more universal conditions are met.")
         print("Result: Planning permission is required (Y).")
@@ -285,5 +608,78 @@ def prompt_user_for_input() -> None:
     print("\nResult: Planning permission required: " + decision)
 
 
+def main_cli(argv=None) -> None:
+    """
+    Command-line entry point.
+
+    All inputs can be given in a single invocation, for example:
+
+      python planning_permission.py --structure fence --location adjacent \\
+          --height above_1m --new-build-property
+
+    and the decision ("Y" or "N") is printed. Universal conditions and
+    modifiers default to False. With --interactive, or with no arguments at
+    all, the interactive prompt (prompt_user_for_input) is used instead.
+
+    Args:
+      argv: Argument list to parse; defaults to sys.argv[1:].
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        description="Determine whether planning permission is required (Y/N)."
+    )
+    parser.add_argument(
+        "--interactive",
+        action="store_true",
+        help="prompt for each input interactively",
+    )
+    parser.add_argument(
+        "--structure", dest="structure_type", choices=list(_S), help="structure type"
+    )
+    parser.add_argument(
+        "--location",
+        dest="location_of_enclosure",
+        choices=list(_L),
+        help="location relative to a road/highway",
+    )
+    parser.add_argument(
+        "--height", dest="height_of_enclosure", choices=list(_H), help="height category"
+    )
+    for name in _UNIVERSAL_FIELDS + (
+        "new_build_property",
+        "pd_removed_by_previous_planning",
+    ):
+        parser.add_argument(
+            "--" + name.replace("_", "-"),
+            dest=name,
+            action=argparse.BooleanOptionalAction,
+            default=False,
+        )
+
+    args = vars(parser.parse_args(argv))
+    if args.pop("interactive") or not argv:
+        prompt_user_for_input()
+        return
+
+    missing = [
+        option
+        for option, dest in (
+            ("--structure", "structure_type"),
+            ("--location", "location_of_enclosure"),
+            ("--height", "height_of_enclosure"),
+        )
+        if args[dest] is None
+    ]
+    if missing:
+        parser.error("the following arguments are required: " + ", ".join(missing))
+
+    print(get_planning_permission_decision(**args))
+
+
 if __name__ == "__main__":
-    prompt_user_for_input()
+    # Configure logging to display messages at INFO level or higher. This is
+    # only done when run as a script so library users keep control of logging.
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    main_cli()
@@ -0,0 +1,45 @@
+# cython: language_level=3
+"""
+Compiled Core of the Planning Permission Decision
+--------------------------------------------------
+Optional Cython implementation of planning_permission.decide_codes, operating
+on the integer codes of the Structure, Location and Height enums.
+
+Build it in place with:
+
+    python setup.py build_ext --inplace
+
+When the extension is not built, planning_permission falls back to its
+pure-Python implementation, which returns identical results.
+"""
+
+
+cpdef str decide_codes(
+    int structure, int location, int height, bint override, bint new_build
+):
+    """
+    Decide planning permission from integer codes.
+
+    Args:
+      structure: Structure code (0 fence, 1 wall, 2 gate).
+      location: Location code (0 adjacent, 1 not_adjacent).
+      height: Height code (0 up_to_1m, 1 above_1m, 2 up_to_2m, 3 above_2m).
+      override: True if any universal condition holds or PD rights were removed.
+      new_build: True for a new build property.
+
+    Returns:
+      "Y" if planning permission is required; otherwise, "N".
+    """
+    if override:
+        return "Y"
+    if not (0 <= structure < 3 and 0 <= location < 2 and 0 <= height < 4):
+        raise ValueError("Enclosure codes out of range")
+
+    if structure == 2:
+        # Gates are permitted unless the property is a new build.
+        return "Y" if new_build else "N"
+    if structure == 0 and location == 0:
+        # Adjacent fences require permission above 1m.
+        return "Y" if height > 0 else "N"
+    # Non-adjacent fences and walls require permission above 2m.
+    return "Y" if height > 2 else "N"
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Numba-Compiled Planning Permission Decision
+-------------------------------------------
+JIT-compiled variant of the decision logic for simulation and Monte-Carlo
+style workloads (e.g. sensitivity analysis over rule inputs) that call the
+rule inside tight loops.
+
+The compiled kernels work purely on integers: structure, location and height
+use the Structure/Location/Height codes from planning_permission, and the
+seven universal conditions are packed into a single int bitmask rather than
+passed as separate booleans, so the kernels behave the same with the JIT
+enabled or disabled (NUMBA_DISABLE_JIT=1).
+
+  - decide_nb decides one case and can be called from other @njit code, so
+    simulation loops stay in compiled code.
+  - decide_nb_array decides a whole set of code arrays in one compiled loop.
+  - get_planning_permission_decision_numba is a convenience wrapper with the
+    string API of planning_permission; its per-call coercion and dispatch make
+    it slower than the pure-Python function, so use the kernels in hot loops.
+
+Requires numba; import planning_permission directly if it is not installed.
+"""
+
+import numpy as np
+from numba import njit
+
+from planning_permission import (
+    _H,
+    _L,
+    _S,
+    Height,
+    Location,
+    Structure,
+    _coerce,
+)
+
+
+@njit(cache=True)
+def _baseline_nb(location, height, structure, new_build):
+    """Return 1 if the non-universal baseline requires permission, otherwise 0."""
+    if structure == 2:
+        # Gates are permitted unless the property is a new build.
+        return 1 if new_build != 0 else 0
+    if structure == 0 and location == 0:
+        # Adjacent fences require permission above 1m.
+        return 1 if height > 0 else 0
+    # Non-adjacent fences and walls require permission above 2m.
+    return 1 if height > 2 else 0
+
+
+@njit(cache=True)
+def decide_nb(location, height, structure, flags_mask, new_build, pd_removed):
+    """
+    Return 1 if planning permission is required, otherwise 0.
+
+    All arguments are ints; flags_mask has one bit per universal condition.
+    Codes are not validated and must be valid Location/Height/Structure values.
+    """
+    if flags_mask != 0 or pd_removed != 0:
+        return 1
+    return _baseline_nb(location, height, structure, new_build)
+
+
+@njit(cache=True)
+def decide_nb_array(location, height, structure, flags_mask, new_build, pd_removed):
+    """
+    Apply decide_nb element-wise over equal-length integer arrays.
+
+    Returns:
+      A uint8 array holding 1 where planning permission is required, otherwise 0.
+    """
+    result = np.empty(location.shape[0], dtype=np.uint8)
+    for row in range(location.shape[0]):
+        result[row] = decide_nb(
+            location[row],
+            height[row],
+            structure[row],
+            flags_mask[row],
+            new_build[row],
+            pd_removed[row],
+        )
+    return result
+
+
+def get_planning_permission_decision_numba(
+    location_of_enclosure: str,
+    height_of_enclosure: str,
+    structure_type: str,
+    listed_building: bool,
+    article_2_3_land: bool,
+    article_2_4_land: bool,
+    article_4_directive: bool,
+    aonb: bool,
+    works_affecting_tpo: bool,
+    face_listed_building: bool,
+    new_build_property: bool,
+    pd_removed_by_previous_planning: bool,
+) -> str:
+    """
+    Same contract as planning_permission.get_planning_permission_decision,
+    with the baseline evaluated by the compiled kernel. As in the scalar API,
+    the universal conditions and PD-removed override are checked before the
+    enclosure inputs are validated.
+
+    Returns:
+      "Y" if planning permission is required; otherwise, "N".
+
+    Raises:
+      ValueError: If the structure type, location or height is not recognised.
+    """
+    if (
+        listed_building
+        | article_2_3_land
+        | article_2_4_land
+        | article_4_directive
+        | aonb
+        | works_affecting_tpo
+        | face_listed_building
+        | pd_removed_by_previous_planning
+    ):
+        return "Y"
+
+    location = _L.get(location_of_enclosure)
+    if location is None:
+        location = _coerce(location_of_enclosure, _L, Location)
+    height = _H.get(height_of_enclosure)
+    if height is None:
+        height = _coerce(height_of_enclosure, _H, Height)
+    structure = _S.get(structure_type)
+    if structure is None:
+        structure = _coerce(structure_type, _S, Structure)
+    required = _baseline_nb(
+        location, height, structure, 1 if new_build_property else 0
+    )
+    return "Y" if required else "N"
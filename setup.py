@@ -0,0 +1,24 @@
+"""
+Build script for the planning permission modules.
+
+    python setup.py build_ext --inplace
+
+builds the optional compiled decision core when Cython is installed. Without
+Cython the pure-Python modules are installed on their own and
+planning_permission falls back to its pure-Python decide_codes.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize("planning_permission_core.pyx")
+
+setup(
+    name="planning-permission",
+    py_modules=["planning_permission", "planning_permission_numba"],
+    ext_modules=ext_modules,
+)